@@ -14,16 +14,21 @@ Key Features:
 - Cross-platform support (Windows, Linux, macOS)
 - UTF-8 encoding support for international file metadata
 - Atomic operations using temporary files for safety
+- In-place header edits with mkvpropedit when only the default track changes
 - Comprehensive logging with progress tracking
 - Dry-run mode for testing without modifications
+- Concurrent processing of multiple files (--jobs)
+- On-disk cache of track information so reruns skip unchanged files (--no-cache)
 - Support for Windows UNC paths and common video formats
 
 Requirements:
-- MKVToolNix tools (mkvmerge executable)
+- MKVToolNix tools (mkvmerge executable; mkvpropedit optional)
 - Python 3.6+
+- orjson (optional, faster parsing of mkvmerge output)
 
 Usage:
-    python scripts/audio/remove_non_english_audio.py <input_folder> [--mkv-tools-path <path>] [--dry-run]
+    python scripts/audio/remove_non_english_audio.py <input_folder> [--mkv-tools-path <path>] [--dry-run] [--jobs <n>]
+        [--work-dir <path>] [--no-cache]
 
 Examples:
     # Windows (from repository root)
@@ -40,11 +45,14 @@ Core Classes:
     AudioTrackRemover: Main processing class handling track analysis and removal
     MKVToolsError: Exception for MKVToolNix tool-related errors
 
-Key Methods:
-    - _run_command: Subprocess execution with UTF-8 encoding support
+Key Functions and Methods:
+    - _run_command: Subprocess execution returning raw bytes output
+    - _options_file: JSON option files passed to mkvmerge as @file
+    - _probe: Cached mkvmerge JSON identification keyed on path, mtime and size
+    - _ProbeCache: Persistent SQLite cache of identification results across runs
     - analyze_audio_tracks: Language detection and track categorization
     - remove_non_english_audio: Main file processing with atomic operations
-    - process_folder: Batch processing with statistics tracking
+    - process_folder: Concurrent batch processing with statistics tracking
 
 IMPORTANT: Always backup your video files before running this script!
 """
@@ -57,15 +65,43 @@ import json
 import shutil
 import logging
 import platform
+import shlex
+import sqlite3
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Iterator, Optional, Tuple, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# orjson parses mkvmerge's JSON output considerably faster; fall back to the
+# standard library when it is not installed
+try:
+    import orjson as _json
+except ImportError:
+    _json = json
 
 
 # Supported video file extensions
-VIDEO_EXTENSIONS = {'.mkv', '.mp4', '.avi', '.m4v', '.mov', '.wmv', '.flv', '.webm'}
+VIDEO_EXTENSIONS = frozenset({'.mkv', '.mp4', '.avi', '.m4v', '.mov', '.wmv', '.flv', '.webm'})
+
+# English language codes that we want to keep (lowercase, '-' separated)
+ENGLISH_CODES = frozenset({'en', 'eng', 'english', 'en-us', 'en-gb'})
+
+# Number of concurrent mkvmerge identification probes when scanning a folder
+PROBE_WORKERS = 16
 
-# English language codes that we want to keep
-ENGLISH_CODES = {'en', 'eng', 'english', 'en-US', 'en-GB'}
+# Kernel pipe capacity requested for captured output on Linux, large enough
+# that mkvmerge can write the JSON of files with many tracks without blocking
+PIPE_BUFFER_SIZE = 1 << 20
+
+logger = logging.getLogger(__name__)
 
 
 class MKVToolsError(Exception):
@@ -73,26 +109,235 @@ class MKVToolsError(Exception):
     pass
 
 
+def _is_mkv(video_file: str) -> bool:
+    """Whether a file is Matroska, the only container this script modifies."""
+    return Path(video_file).suffix.lower() == '.mkv'
+
+
+def _configure_logging() -> None:
+    """Send log output to the console and mkv_audio_removal.log, once per process."""
+    if logging.getLogger().handlers:
+        return
+    
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler('mkv_audio_removal.log'),
+            logging.StreamHandler(sys.stdout)
+        ]
+    )
+
+
+def _grow_pipe(pipe) -> None:
+    """Enlarge a pipe's kernel buffer on Linux so the child rarely blocks on a full pipe."""
+    set_pipe_size = getattr(fcntl, 'F_SETPIPE_SZ', None)
+    if set_pipe_size is None:
+        return
+    try:
+        fcntl.fcntl(pipe.fileno(), set_pipe_size, PIPE_BUFFER_SIZE)
+    except OSError:
+        # Larger than /proc/sys/fs/pipe-max-size allows; keep the default
+        pass
+
+
+def _run_command(cmd: List[str], capture_output: bool = True) -> subprocess.CompletedProcess:
+    """
+    Run a command and return the result, raising CalledProcessError on failure.
+    
+    Captured stdout and stderr are returned as bytes; stderr is only decoded
+    when a failure is logged.
+    """
+    # A new session keeps a Ctrl-C in the terminal from killing an in-progress
+    # remux; the script stops scheduling new files instead
+    if capture_output:
+        # Captured output is left as raw bytes so JSON can be parsed without
+        # decoding it first
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                              start_new_session=True) as process:
+            _grow_pipe(process.stdout)
+            try:
+                stdout, stderr = process.communicate()
+            except BaseException:
+                process.kill()
+                raise
+        result = subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
+    else:
+        # Output goes straight to the terminal, so there is nothing to decode
+        result = subprocess.run(cmd, start_new_session=True)
+    
+    if result.returncode:
+        logger.error(f"Command failed: {' '.join(shlex.quote(arg) for arg in cmd)}")
+        if result.stderr:
+            logger.error(f"Error: {result.stderr.decode('utf-8', errors='replace')}")
+        else:
+            logger.error(f"Error: exit status {result.returncode}")
+        raise subprocess.CalledProcessError(result.returncode, cmd, result.stdout, result.stderr)
+    
+    return result
+
+
+@contextmanager
+def _options_file(args: List[str]) -> Iterator[List[str]]:
+    """
+    Write mkvmerge arguments to a temporary JSON option file.
+    
+    Yields the arguments to pass to mkvmerge: ['@<file>'], which sidesteps
+    command-line length limits and shell quoting issues on Windows. Arguments
+    that can't be stored as UTF-8 (e.g. file names with undecodable bytes)
+    are yielded unchanged to be passed on the command line instead.
+    """
+    try:
+        data = json.dumps(args, ensure_ascii=False).encode('utf-8')
+    except UnicodeEncodeError:
+        data = None
+    
+    if data is None:
+        yield args
+        return
+    
+    fd, name = tempfile.mkstemp(suffix='.json')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        yield [f"@{name}"]
+    finally:
+        os.unlink(name)
+
+
+def _make_temp_file(video_path: Path, directory: Union[str, Path]) -> Path:
+    """
+    Create a uniquely named empty file in directory for a processed copy of video_path.
+    
+    Unique names keep concurrent runs over the same folder from writing to
+    each other's temporary files.
+    """
+    fd, temp_name = tempfile.mkstemp(suffix=video_path.suffix, prefix=video_path.stem + '.',
+                                     dir=str(directory))
+    os.close(fd)
+    return Path(temp_name)
+
+
+class _ProbeCache:
+    """
+    On-disk SQLite cache of mkvmerge identification output.
+    
+    Entries are keyed on path, modification time and size, so reruns over
+    unchanged files skip mkvmerge entirely while modified files are probed again.
+    Paths are stored as their raw filesystem bytes so names that aren't valid
+    UTF-8 can be cached too.
+    """
+    
+    def __init__(self, db_path: str):
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        # One connection is shared by the probe threads, serialized by a lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS probes ('
+            'path BLOB, mtime INTEGER, size INTEGER, json BLOB, '
+            'PRIMARY KEY (path, mtime, size))'
+        )
+    
+    def get(self, path: str, mtime_ns: int, size: int) -> Optional[bytes]:
+        """Return the cached JSON for a file, or None on a miss."""
+        try:
+            key = os.fsencode(path)
+            with self._lock:
+                row = self._conn.execute(
+                    'SELECT json FROM probes WHERE path = ? AND mtime = ? AND size = ?',
+                    (key, mtime_ns, size)
+                ).fetchone()
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"Probe cache lookup failed for {path}: {e}")
+            return None
+        return row[0] if row else None
+    
+    def put(self, path: str, mtime_ns: int, size: int, data: bytes) -> None:
+        """Store the JSON for a file, replacing any entries for older versions of it."""
+        try:
+            key = os.fsencode(path)
+            with self._lock:
+                self._conn.execute('BEGIN')
+                try:
+                    self._conn.execute('DELETE FROM probes WHERE path = ?', (key,))
+                    self._conn.execute(
+                        'INSERT OR REPLACE INTO probes (path, mtime, size, json) VALUES (?, ?, ?, ?)',
+                        (key, mtime_ns, size, data)
+                    )
+                    self._conn.execute('COMMIT')
+                except sqlite3.Error:
+                    self._conn.execute('ROLLBACK')
+                    raise
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"Probe cache update failed for {path}: {e}")
+
+
+def _default_cache_path() -> str:
+    """Location of the persistent probe cache."""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'mkvscripts', 'probes.sqlite')
+
+
+@lru_cache(maxsize=4096)
+def _probe(mkvmerge_path: str, video_file: str, mtime_ns: int, size: int,
+           cache: Optional[_ProbeCache] = None) -> Dict:
+    """
+    Identify a file with mkvmerge and parse its JSON output.
+    
+    The modification time and size are only part of the cache key, so a file
+    that changes on disk is probed again instead of reusing stale results.
+    When a _ProbeCache is given it is consulted before running mkvmerge.
+    """
+    data = cache.get(video_file, mtime_ns, size) if cache else None
+    if data is not None:
+        try:
+            return _json.loads(data)
+        except ValueError:
+            # Probe again below; put() then overwrites the bad entry
+            logger.warning(f"Ignoring unreadable probe cache entry for {video_file}")
+    
+    with _options_file(['--identification-format', 'json', '--identify', video_file]) as options:
+        result = _run_command([mkvmerge_path] + options)
+    track_info = _json.loads(result.stdout)
+    
+    if cache:
+        cache.put(video_file, mtime_ns, size, result.stdout)
+    return track_info
+
+
 class AudioTrackRemover:
     """Handles the removal of non-English audio tracks from video files."""
     
-    def __init__(self, mkv_tools_path: Optional[str] = None, dry_run: bool = False):
+    def __init__(self, mkv_tools_path: Optional[str] = None, dry_run: bool = False,
+                 jobs: int = 1, work_dir: Optional[str] = None, use_cache: bool = True):
         self.mkv_tools_path = mkv_tools_path
         self.dry_run = dry_run
+        self.jobs = max(1, jobs)
+        self.work_dir = work_dir
         self.mkvmerge_path = self._find_mkv_executable('mkvmerge')
         
-        # Setup logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('mkv_audio_removal.log'),
-                logging.StreamHandler(sys.stdout)
-            ]
-        )
+        # mkvpropedit is optional; without it default-track changes fall back to a remux
+        try:
+            self.mkvpropedit_path = self._find_mkv_executable('mkvpropedit')
+        except MKVToolsError:
+            self.mkvpropedit_path = None
+        
         self.logger = logging.getLogger(__name__)
         
-        self.logger.info(f"MKV tools found: mkvmerge={self.mkvmerge_path}")
+        # The probe cache is an optimization only; run without it if it can't be opened
+        self.probe_cache = None
+        if use_cache:
+            cache_path = _default_cache_path()
+            try:
+                self.probe_cache = _ProbeCache(cache_path)
+            except (OSError, sqlite3.Error) as e:
+                self.logger.warning(f"Probe cache disabled, could not open {cache_path}: {e}")
+        
+        self.logger.info(f"MKV tools found: mkvmerge={self.mkvmerge_path}, "
+                         f"mkvpropedit={self.mkvpropedit_path or 'not found'}")
         if self.dry_run:
             self.logger.info("DRY RUN MODE: No files will be modified")
     
@@ -140,27 +385,30 @@ class AudioTrackRemover:
         
         raise MKVToolsError(f"{exe_name} not found in PATH or common locations")
     
-    def _run_command(self, cmd: List[str], capture_output: bool = True) -> subprocess.CompletedProcess:
-        """Run a command and return the result."""
+    def get_track_info(self, video_file: str, mtime_ns: Optional[int] = None,
+                       size: Optional[int] = None) -> Dict:
+        """
+        Get track information from a video file using mkvmerge -J.
+        
+        mtime_ns and size may be passed when already known (e.g. from
+        find_video_files) to avoid statting the file again.
+        """
         try:
-            if capture_output:
-                result = subprocess.run(cmd, capture_output=True, text=True, check=True, encoding='utf-8')
-            else:
-                result = subprocess.run(cmd, check=True, encoding='utf-8')
-            return result
-        except subprocess.CalledProcessError as e:
-            self.logger.error(f"Command failed: {' '.join(cmd)}")
-            self.logger.error(f"Error: {e.stderr if hasattr(e, 'stderr') else str(e)}")
-            raise
+            if mtime_ns is None or size is None:
+                stat = os.stat(video_file)
+                mtime_ns, size = stat.st_mtime_ns, stat.st_size
+            return _probe(self.mkvmerge_path, os.path.abspath(video_file),
+                          mtime_ns, size, self.probe_cache)
+        except (OSError, subprocess.CalledProcessError, json.JSONDecodeError) as e:
+            self.logger.error(f"Failed to get track info for {video_file}: {e}")
+            return {}
     
-    def get_track_info(self, video_file: str) -> Dict:
-        """Get track information from a video file using mkvmerge -J."""
-        cmd = [self.mkvmerge_path, '-J', video_file]
-        
+    def _prefetch_track_info(self, entry: Tuple[str, int, int]) -> Dict:
+        """Get track info for a find_video_files entry without letting one file abort the batch."""
+        video_file, mtime_ns, size = entry
         try:
-            result = self._run_command(cmd)
-            return json.loads(result.stdout)
-        except (subprocess.CalledProcessError, json.JSONDecodeError) as e:
+            return self.get_track_info(video_file, mtime_ns, size)
+        except Exception as e:
             self.logger.error(f"Failed to get track info for {video_file}: {e}")
             return {}
     
@@ -171,53 +419,54 @@ class AudioTrackRemover:
         Returns:
             Tuple of (english_tracks_info, non_english_track_ids)
         """
+        # Pull (id, language, is_default) out of every audio track in one pass.
+        # Languages are normalized so tags like 'en-US' and 'en_GB' match ENGLISH_CODES
+        audio_tracks = [
+            (track['id'],
+             (track.get('properties') or {}).get('language', '').lower().replace('_', '-'),
+             (track.get('properties') or {}).get('default_track', False))
+            for track in track_info.get('tracks', ())
+            if track.get('type') == 'audio' and track.get('id') is not None
+        ]
+        
         english_tracks = []
         non_english_tracks = []
         
-        if 'tracks' not in track_info:
-            return english_tracks, non_english_tracks
-        
-        for track in track_info['tracks']:
-            if track.get('type') == 'audio':
-                track_id = track.get('id')
-                if track_id is None:
-                    continue
-                
-                # Check language property
-                properties = track.get('properties', {})
-                language = properties.get('language', '').lower()
-                is_default = properties.get('default_track', False)
-                
-                track_info_dict = {
-                    'id': track_id,
-                    'language': language,
-                    'is_default': is_default,
-                    'properties': properties
-                }
-                
-                # If no language specified, assume English (common default)
-                if not language or language == 'und':
-                    self.logger.warning(f"Track {track_id} has undefined language, assuming English")
-                    english_tracks.append(track_info_dict)
-                elif language in ENGLISH_CODES:
-                    english_tracks.append(track_info_dict)
-                else:
-                    non_english_tracks.append(track_id)
-                    self.logger.info(f"Found non-English audio track {track_id} with language: {language}")
+        for track_id, language, is_default in audio_tracks:
+            # If no language specified, assume English (common default)
+            if not language or language == 'und':
+                self.logger.warning(f"Track {track_id} has undefined language, assuming English")
+            elif language not in ENGLISH_CODES:
+                non_english_tracks.append(track_id)
+                self.logger.info(f"Found non-English audio track {track_id} with language: {language}")
+                continue
+            
+            english_tracks.append({'id': track_id, 'language': language, 'is_default': is_default})
         
         return english_tracks, non_english_tracks
     
-    def remove_non_english_audio(self, video_file: str) -> bool:
+    def remove_non_english_audio(self, video_file: str, track_info: Optional[Dict] = None) -> bool:
         """
         Remove non-English audio tracks from a video file and set English as default.
         
+        Args:
+            video_file: Path of the video file to process
+            track_info: Previously fetched get_track_info() result, probed if omitted
+        
         Returns:
             True if file was modified, False otherwise
         """
         self.logger.info(f"Processing: {video_file}")
         
+        # mkvmerge always writes Matroska, so remuxing other containers would
+        # leave Matroska data behind an .mp4/.avi/... extension
+        if not _is_mkv(video_file):
+            self.logger.info(f"Skipping {video_file} - only .mkv files are modified")
+            return False
+        
         # Get track information
-        track_info = self.get_track_info(video_file)
+        if track_info is None:
+            track_info = self.get_track_info(video_file)
         if not track_info:
             self.logger.error(f"Could not get track info for {video_file}")
             return False
@@ -255,35 +504,51 @@ class AudioTrackRemover:
                 self.logger.info(f"DRY RUN: Would set track {english_tracks[0]['id']} as default")
             return True
         
-        # Create temporary output file
         video_path = Path(video_file)
-        temp_file = video_path.with_suffix('.temp' + video_path.suffix)
+        
+        # Flipping default flags only touches the Matroska headers, so edit them
+        # in place instead of rewriting the whole file
+        if not needs_track_removal and self.mkvpropedit_path:
+            return self._set_default_track_in_place(video_file, english_tracks)
+        
+        # Create temporary output file, optionally on a faster working disk
+        temp_file = _make_temp_file(video_path, self.work_dir or video_path.parent)
+        staged_file = temp_file
         
         try:
-            # Build mkvmerge command
-            cmd = [self.mkvmerge_path, '-o', str(temp_file)]
+            # Build mkvmerge arguments
+            args = ['-o', str(temp_file)]
             
             # Set default audio track (first English track)
             if needs_default_change:
-                cmd.extend(['--default-track', f"{english_tracks[0]['id']}:yes"])
+                args.extend(['--default-track', f"{english_tracks[0]['id']}:yes"])
                 # Set all other audio tracks to not default
                 for track in english_tracks[1:]:
-                    cmd.extend(['--default-track', f"{track['id']}:no"])
+                    args.extend(['--default-track', f"{track['id']}:no"])
             
             # Add audio track selection (exclude non-English tracks)
             if needs_track_removal:
                 # Include only English tracks
                 english_track_ids = [str(track['id']) for track in english_tracks]
-                cmd.extend(['-a', ','.join(english_track_ids)])
+                args.extend(['-a', ','.join(english_track_ids)])
             
-            cmd.append(video_file)
+            args.append(video_file)
             
-            self.logger.info(f"Running: {' '.join(cmd)}")
-            self._run_command(cmd, capture_output=False)
+            self.logger.info(f"Running: {self.mkvmerge_path} {json.dumps(args, ensure_ascii=False)}")
+            with _options_file(args) as options:
+                _run_command([self.mkvmerge_path] + options, capture_output=False)
             
-            # Replace original with processed file
-            video_path.unlink()  # Remove original
-            temp_file.rename(video_path)  # Rename temp to original
+            # os.replace can't cross filesystems, so bring a file from the working
+            # directory next to the original before swapping it in
+            if self.work_dir:
+                staged_file = _make_temp_file(video_path, video_path.parent)
+                shutil.move(str(temp_file), str(staged_file))
+            
+            # mkstemp creates files readable only by the owner; keep the original's mode
+            shutil.copymode(str(video_path), str(staged_file))
+            
+            # Atomically replace original with processed file
+            os.replace(staged_file, video_path)
             
             self.logger.info(f"Successfully processed {video_file}")
             
@@ -292,14 +557,42 @@ class AudioTrackRemover:
         except Exception as e:
             self.logger.error(f"Failed to process {video_file}: {e}")
             
-            # Clean up temp file if it exists
-            if temp_file.exists():
-                temp_file.unlink()
+            # Clean up temp files if they exist
+            for path in {temp_file, staged_file}:
+                if path.exists():
+                    path.unlink()
                 
             return False
     
-    def find_video_files(self, root_folder: str) -> List[str]:
-        """Recursively find all video files in the given folder."""
+    def _set_default_track_in_place(self, video_file: str, audio_tracks: List[Dict]) -> bool:
+        """
+        Make the first audio track the default using mkvpropedit, without a remux.
+        
+        Returns:
+            True if the file was modified, False otherwise
+        """
+        # mkvmerge track IDs are 0-based while mkvpropedit track numbers are 1-based
+        cmd = [self.mkvpropedit_path, video_file,
+               '--edit', f"track:{audio_tracks[0]['id'] + 1}", '--set', 'flag-default=1']
+        for track in audio_tracks[1:]:
+            cmd.extend(['--edit', f"track:{track['id'] + 1}", '--set', 'flag-default=0'])
+        
+        try:
+            self.logger.info(f"Running: {' '.join(shlex.quote(arg) for arg in cmd)}")
+            _run_command(cmd, capture_output=False)
+            self.logger.info(f"Successfully processed {video_file}")
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to process {video_file}: {e}")
+            return False
+    
+    def find_video_files(self, root_folder: str) -> List[Tuple[str, int, int]]:
+        """
+        Recursively find all video files in the given folder.
+        
+        Returns:
+            Sorted list of (path, mtime_ns, size) tuples
+        """
         video_files = []
         root_path = Path(root_folder)
         
@@ -309,9 +602,35 @@ class AudioTrackRemover:
         if not root_path.is_dir():
             raise NotADirectoryError(f"Path is not a directory: {root_folder}")
         
-        for file_path in root_path.rglob('*'):
-            if file_path.is_file() and file_path.suffix.lower() in VIDEO_EXTENSIONS:
-                video_files.append(str(file_path))
+        # Walk with os.scandir so file types come from the directory listing
+        # instead of an extra stat call per entry
+        stack = [str(root_path)]
+        while stack:
+            directory = stack.pop()
+            try:
+                entries = os.scandir(directory)
+            except PermissionError as e:
+                # Like Path.rglob, skip folders we can't read (e.g. '#recycle')
+                self.logger.warning(f"Skipping unreadable folder {directory}: {e}")
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                    # Plain string slicing; like Path.suffix, a leading dot
+                    # (e.g. '.mkv' itself) is not treated as an extension
+                    name = entry.name
+                    dot = name.rfind('.')
+                    if dot > 0 and name[dot:].lower() in VIDEO_EXTENSIONS and entry.is_file():
+                        # Collected now so probe cache lookups don't stat each file again
+                        try:
+                            stat = entry.stat()
+                        except OSError as e:
+                            # Removed or renamed since the directory was listed
+                            self.logger.warning(f"Skipping {entry.path}: {e}")
+                            continue
+                        video_files.append((entry.path, stat.st_mtime_ns, stat.st_size))
         
         return sorted(video_files)
     
@@ -334,15 +653,40 @@ class AudioTrackRemover:
             
             self.logger.info(f"Found {len(video_files)} video files to process")
             
-            for video_file in video_files:
+            # Identify every file up front. Probes mostly wait on mkvmerge start-up
+            # and header reads, so many of them can overlap
+            mkv_files = [entry for entry in video_files if _is_mkv(entry[0])]
+            probes = {}
+            if mkv_files:
+                with ThreadPoolExecutor(max_workers=min(PROBE_WORKERS, len(mkv_files))) as executor:
+                    track_infos = executor.map(self._prefetch_track_info, mkv_files)
+                    probes = dict(zip((path for path, _, _ in mkv_files), track_infos))
+            
+            # The heavy lifting happens in mkvmerge subprocesses, so threads are
+            # enough to keep several remuxes running at once
+            max_workers = min(self.jobs, len(video_files))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(self.remove_non_english_audio, video_file,
+                                    probes.get(video_file)): video_file
+                    for video_file, _, _ in video_files
+                }
                 try:
-                    if self.remove_non_english_audio(video_file):
-                        stats['processed_files'] += 1
-                    else:
-                        stats['skipped_files'] += 1
-                except Exception as e:
-                    self.logger.error(f"Error processing {video_file}: {e}")
-                    stats['error_files'] += 1
+                    for future in as_completed(futures):
+                        video_file = futures[future]
+                        try:
+                            if future.result():
+                                stats['processed_files'] += 1
+                            else:
+                                stats['skipped_files'] += 1
+                        except Exception as e:
+                            self.logger.error(f"Error processing {video_file}: {e}")
+                            stats['error_files'] += 1
+                except KeyboardInterrupt:
+                    # Don't start any files that are still queued
+                    for future in futures:
+                        future.cancel()
+                    raise
             
             return stats
             
@@ -374,8 +718,29 @@ def main():
         help='Show what would be done without actually modifying files'
     )
     
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=max(1, (os.cpu_count() or 1) // 2),
+        help='Number of files to process concurrently (default: half the CPU count)'
+    )
+    
+    parser.add_argument(
+        '--work-dir',
+        help='Directory for temporary files, e.g. on a fast local SSD (default: next to each video)'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Do not read or write the on-disk cache of mkvmerge track information'
+    )
+    
     args = parser.parse_args()
     
+    if args.work_dir and not os.path.isdir(args.work_dir):
+        parser.error(f"work directory not found: {args.work_dir}")
+    
     if not args.dry_run:
         print("WARNING: This script will modify your video files directly!")
         print("Make sure you have backed up your files before proceeding.")
@@ -384,10 +749,15 @@ def main():
             print("Operation cancelled.")
             sys.exit(0)
     
+    _configure_logging()
+    
     try:
         remover = AudioTrackRemover(
             mkv_tools_path=args.mkv_tools_path,
-            dry_run=args.dry_run
+            dry_run=args.dry_run,
+            jobs=args.jobs,
+            work_dir=args.work_dir,
+            use_cache=not args.no_cache
         )
         
         print(f"\nProcessing folder: {args.input_folder}")